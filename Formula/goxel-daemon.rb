@@ -14,8 +14,6 @@ class GoxelDaemon < Formula
   
   depends_on "libpng"
   depends_on "mesa"
-  depends_on "pkg-config" => :build
-  depends_on "scons" => :build
 
   def install
     # Install the pre-built binary
@@ -70,19 +68,28 @@ class GoxelDaemon < Formula
         exec bin/"goxel-daemon", "--socket", socket_path, "--foreground"
       end
       
-      sleep 2
-      
       begin
+        # Wait until the daemon accepts connections instead of a fixed sleep
+        deadline = Process.clock_gettime(Process::CLOCK_MONOTONIC) + 10
+        delay = 0.001
+        begin
+          sock = UNIXSocket.new(socket_path)
+        rescue Errno::ENOENT, Errno::ECONNREFUSED
+          raise if Process.clock_gettime(Process::CLOCK_MONOTONIC) > deadline
+          sleep delay
+          delay = [delay * 2, 0.128].min
+          retry
+        end
+
         # Test connection
-        sock = UNIXSocket.new(socket_path)
         request = {
           "jsonrpc" => "2.0",
           "method" => "goxel.get_status",
           "params" => [],
           "id" => 1
         }
-        sock.send(JSON.generate(request) + "\n", 0)
-        response = sock.recv(4096)
+        sock.puts JSON.generate(request)
+        response = sock.gets
         assert_match '"result":', response
         sock.close
       ensure